@@ -1,8 +1,9 @@
 """Price API routes."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
-from app.core.response import SuccessResponse, success_response
+from app.core.response import SuccessResponse, etag_response
+from app.schemas.docs_examples import PRICES_LIST_EXAMPLE, success_example
 from app.schemas.price import PricesListResponse
 from app.services.price_service import price_service
 
@@ -12,15 +13,17 @@ router = APIRouter(prefix="/crypto", tags=["Prices"])
 
 @router.get(
     "/prices",
-    response_model=SuccessResponse[PricesListResponse],
+    responses={
+        200: {
+            "model": SuccessResponse[PricesListResponse],
+            "content": success_example("Prices retrieved successfully", PRICES_LIST_EXAMPLE),
+        }
+    },
     summary="Get current prices",
     description="Get current cryptocurrency prices for BTC, ETH, and USDT with NGN conversion.",
 )
-async def get_prices():
+async def get_prices(request: Request):
     """Get current cryptocurrency prices with NGN conversion."""
-    prices = await price_service.get_all_prices()
+    body, etag = await price_service.get_prices_snapshot()
     
-    return success_response(
-        message="Prices retrieved successfully",
-        data=prices.model_dump(),
-    )
+    return etag_response(request, body, etag)
@@ -2,9 +2,21 @@
 
 from typing import List
 
-from fastapi import APIRouter, status
-
-from app.core.response import SuccessResponse, success_response
+from beanie import PydanticObjectId
+from fastapi import APIRouter, Request, status
+
+from app.core.response import (
+    SuccessResponse,
+    etag_response,
+    success_json,
+    success_json_response,
+)
+from app.schemas.docs_examples import (
+    PORTFOLIO_VALUE_EXAMPLE,
+    WALLET_BALANCE_EXAMPLE,
+    WALLET_EXAMPLE,
+    success_example,
+)
 from app.schemas.wallet import (
     PortfolioValueResponse,
     WalletBalanceResponse,
@@ -20,8 +32,13 @@ router = APIRouter(prefix="/wallets", tags=["Wallets"])
 
 @router.post(
     "/generate",
-    response_model=SuccessResponse[WalletResponse],
     status_code=status.HTTP_201_CREATED,
+    responses={
+        201: {
+            "model": SuccessResponse[WalletResponse],
+            "content": success_example("Successfully created ethereum wallet", WALLET_EXAMPLE),
+        }
+    },
     summary="Generate new wallet",
     description="Generate a new cryptocurrency wallet for the specified network (ethereum or bitcoin).",
 )
@@ -30,91 +47,114 @@ async def generate_wallet(request: WalletCreateRequest):
     wallet = await wallet_service.create_wallet(request.network)
     response = wallet_service.to_response(wallet)
     
-    return success_response(
+    return success_json_response(
         message=f"Successfully created {request.network.value} wallet",
-        data=response.model_dump(),
+        data=response,
+        status_code=status.HTTP_201_CREATED,
     )
 
 
 @router.get(
     "",
-    response_model=SuccessResponse[List[WalletResponse]],
+    responses={
+        200: {
+            "model": SuccessResponse[List[WalletResponse]],
+            "content": success_example("Wallets retrieved successfully", [WALLET_EXAMPLE]),
+        }
+    },
     summary="List all wallets",
     description="Retrieve a list of all generated wallets.",
 )
-async def list_wallets():
+async def list_wallets(request: Request):
     """List all wallets."""
     wallets = await wallet_service.get_all_wallets()
     response = [wallet_service.to_response(w) for w in wallets]
     
-    return success_response(
+    body = success_json(
         message="Wallets retrieved successfully",
-        data=[r.model_dump() for r in response],
+        data=response,
     )
+    return etag_response(request, body)
 
 
 @router.get(
     "/balance",
-    response_model=SuccessResponse[PortfolioValueResponse],
+    responses={
+        200: {
+            "model": SuccessResponse[PortfolioValueResponse],
+            "content": success_example("Portfolio value retrieved successfully", PORTFOLIO_VALUE_EXAMPLE),
+        }
+    },
     summary="Get portfolio value",
     description="Get the total portfolio value across all wallets in USD and NGN.",
 )
-async def get_portfolio_balance():
+async def get_portfolio_balance(request: Request):
     """Get total portfolio value across all wallets."""
     wallets = await wallet_service.get_all_wallets()
     portfolio = await balance_service.get_portfolio_value(wallets)
     
-    return success_response(
+    body = success_json(
         message="Portfolio value retrieved successfully",
-        data=portfolio.model_dump(),
+        data=portfolio,
     )
+    return etag_response(request, body)
 
 
 @router.get(
     "/{wallet_id}",
-    response_model=SuccessResponse[WalletResponse],
+    responses={
+        200: {
+            "model": SuccessResponse[WalletResponse],
+            "content": success_example("Wallet retrieved successfully", WALLET_EXAMPLE),
+        }
+    },
     summary="Get wallet details",
     description="Retrieve details for a specific wallet by its ID.",
 )
-async def get_wallet(wallet_id: str):
+async def get_wallet(wallet_id: PydanticObjectId):
     """Get wallet details by ID."""
     wallet = await wallet_service.get_wallet(wallet_id)
     response = wallet_service.to_response(wallet)
     
-    return success_response(
+    return success_json_response(
         message="Wallet retrieved successfully",
-        data=response.model_dump(),
+        data=response,
     )
 
 
 @router.get(
     "/{wallet_id}/balance",
-    response_model=SuccessResponse[WalletBalanceResponse],
+    responses={
+        200: {
+            "model": SuccessResponse[WalletBalanceResponse],
+            "content": success_example("Wallet balance retrieved successfully", WALLET_BALANCE_EXAMPLE),
+        }
+    },
     summary="Get wallet balance",
     description="Get the balance for a specific wallet with USD and NGN conversion. Optionally specify asset (e.g., USDT).",
 )
-async def get_wallet_balance(wallet_id: str, asset: str = None):
+async def get_wallet_balance(wallet_id: PydanticObjectId, asset: str = None):
     """Get wallet balance with currency conversion."""
     wallet = await wallet_service.get_wallet(wallet_id)
     balance = await balance_service.get_wallet_balance(wallet, asset)
     
-    return success_response(
+    return success_json_response(
         message="Wallet balance retrieved successfully",
-        data=balance.model_dump(),
+        data=balance,
     )
 
 
 @router.delete(
     "/{wallet_id}",
-    response_model=SuccessResponse[dict],
+    responses={200: {"model": SuccessResponse[dict]}},
     summary="Delete wallet",
     description="Delete a wallet by its ID.",
 )
-async def delete_wallet(wallet_id: str):
+async def delete_wallet(wallet_id: PydanticObjectId):
     """Delete a wallet by ID."""
     await wallet_service.delete_wallet(wallet_id)
     
-    return success_response(
+    return success_json_response(
         message="Wallet deleted successfully",
         data={"deleted": True},
     )
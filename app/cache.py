@@ -1,25 +1,40 @@
 """Redis cache connection and utilities."""
 
-import json
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
+import orjson
 import redis.asyncio as redis
+from cachetools import TTLCache
 
 from app.config import get_settings
 
 
+# In-process cache in front of Redis for hot, rarely-changing keys
+LOCAL_CACHE_MAXSIZE = 256
+LOCAL_CACHE_TTL_SECONDS = 5
+
+_DEFAULT_TTL = get_settings().redis_ttl_seconds
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value to JSON bytes for storage."""
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
 class Cache:
     """Redis cache manager."""
     
     client: redis.Redis = None
     
+    def __init__(self) -> None:
+        self._local: TTLCache = TTLCache(maxsize=LOCAL_CACHE_MAXSIZE, ttl=LOCAL_CACHE_TTL_SECONDS)
+    
     async def connect(self) -> None:
         """Establish connection to Redis."""
         settings = get_settings()
         self.client = redis.from_url(
             settings.redis_url,
-            encoding="utf-8",
-            decode_responses=True,
+            decode_responses=False,
         )
     
     async def disconnect(self) -> None:
@@ -27,30 +42,70 @@ class Cache:
         if self.client:
             await self.client.close()
     
-    async def get(self, key: str) -> Optional[Any]:
-        """Retrieve value from cache."""
+    async def get(self, key: str, local: bool = False) -> Optional[Any]:
+        """
+        Retrieve value from cache.
+        
+        Args:
+            key: Cache key
+            local: Also consult and populate the in-process cache, which
+                may serve values up to LOCAL_CACHE_TTL_SECONDS stale
+        """
+        if local:
+            value = self._local.get(key)
+            if value is not None:
+                return value
+        
         if not self.client:
             return None
         
         value = await self.client.get(key)
         if value:
-            return json.loads(value)
+            value = orjson.loads(value)
+            if local:
+                self._local[key] = value
+            return value
         return None
     
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None, local: bool = False) -> None:
         """Store value in cache with optional TTL."""
+        if local:
+            self._local[key] = value
+        
         if not self.client:
             return
         
-        settings = get_settings()
-        ttl = ttl or settings.redis_ttl_seconds
+        ttl = ttl or _DEFAULT_TTL
         
-        await self.client.set(key, json.dumps(value), ex=ttl)
+        await self.client.set(key, _dumps(value), ex=ttl)
     
-    async def delete(self, key: str) -> None:
-        """Remove value from cache."""
-        if self.client:
-            await self.client.delete(key)
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Retrieve several values from cache in a single round-trip."""
+        if not self.client or not keys:
+            return [None] * len(keys)
+        
+        values = await self.client.mget(keys)
+        return [orjson.loads(value) if value else None for value in values]
+    
+    async def mset(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store several values in cache with a shared TTL in a single round-trip."""
+        if not self.client or not mapping:
+            return
+        
+        ttl = ttl or _DEFAULT_TTL
+        
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, _dumps(value), ex=ttl)
+            await pipe.execute()
+    
+    async def delete(self, *keys: str) -> None:
+        """Remove one or more values from cache."""
+        for key in keys:
+            self._local.pop(key, None)
+        
+        if self.client and keys:
+            await self.client.delete(*keys)
 
 
 cache = Cache()
@@ -20,6 +20,10 @@ class Settings(BaseSettings):
     # MongoDB
     mongodb_url: str = "mongodb://localhost:27017"
     mongodb_database: str = "blockai"
+    mongodb_max_pool_size: int = 20
+    mongodb_min_pool_size: int = 2
+    mongodb_server_selection_timeout_ms: int = 2000
+    mongodb_compressors: str = "zstd,zlib"
     
     # Redis
     redis_url: str = "redis://localhost:6379"
@@ -24,6 +24,7 @@ def setup_logging(level: Optional[str] = None) -> logging.Logger:
     logger = logging.getLogger("blockai")
     logger.setLevel(log_level)
     logger.addHandler(handler)
+    logger.propagate = False
     
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
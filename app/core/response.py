@@ -1,7 +1,10 @@
 """Standardized API response DTOs."""
 
+import hashlib
 from typing import Any, Generic, Optional, TypeVar
 
+import orjson
+from fastapi import Request, Response
 from pydantic import BaseModel, Field
 
 T = TypeVar("T")
@@ -32,6 +35,30 @@ def success_response(message: str, data: Any) -> dict:
     }
 
 
+def success_json(message: str, data: Any) -> bytes:
+    """
+    Serialize a standardized success response in a single pass.
+    
+    The envelope is dumped with Pydantic's Rust serializer, so model
+    payloads go straight to JSON bytes without an intermediate dict.
+    """
+    return SuccessResponse(message=message, data=data).model_dump_json().encode()
+
+
+def success_json_response(message: str, data: Any, status_code: int = 200) -> Response:
+    """Create a pre-serialized standardized success response."""
+    return Response(
+        content=success_json(message, data),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def success_bytes(message: str, data: bytes) -> bytes:
+    """Create a standardized success response around already-serialized JSON data."""
+    return b'{"success":true,"message":' + orjson.dumps(message) + b',"data":' + data + b"}"
+
+
 def error_response(message: str, error: str) -> dict:
     """Create a standardized error response."""
     return {
@@ -39,3 +66,43 @@ def error_response(message: str, error: str) -> dict:
         "message": message,
         "error": error,
     }
+
+
+def compute_etag(body: bytes) -> str:
+    """Compute a weak ETag for a response body."""
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Check an ETag against an If-None-Match header using weak comparison."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def etag_response(request: Request, body: bytes, etag: Optional[str] = None) -> Response:
+    """
+    Create a JSON response tagged with an ETag.
+    
+    Returns an empty 304 Not Modified instead when the client already
+    holds the current representation.
+    
+    Args:
+        request: Incoming request carrying any If-None-Match header
+        body: Serialized JSON response body
+        etag: Precomputed ETag for the body, computed if omitted
+    """
+    etag = etag or compute_etag(body)
+    headers = {"ETag": etag}
+    
+    if _etag_matches(etag, request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -15,7 +15,14 @@ class Database:
     async def connect(self) -> None:
         """Establish connection to MongoDB."""
         settings = get_settings()
-        self.client = AsyncIOMotorClient(settings.mongodb_url)
+        self.client = AsyncIOMotorClient(
+            settings.mongodb_url,
+            maxPoolSize=settings.mongodb_max_pool_size,
+            minPoolSize=settings.mongodb_min_pool_size,
+            serverSelectionTimeoutMS=settings.mongodb_server_selection_timeout_ms,
+            compressors=settings.mongodb_compressors,
+            uuidRepresentation="standard",
+        )
         
         await init_beanie(
             database=self.client[settings.mongodb_database],
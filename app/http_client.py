@@ -0,0 +1,49 @@
+"""Shared HTTP client for outbound API and RPC calls."""
+
+import asyncio
+
+import httpx
+
+
+HTTP_TIMEOUT = httpx.Timeout(15.0)
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+class HTTPClient:
+    """Pooled HTTP client manager."""
+    
+    client: httpx.AsyncClient = None
+    
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+    
+    async def connect(self) -> None:
+        """Create the shared connection pool."""
+        await self.get_client()
+    
+    async def get_client(self) -> httpx.AsyncClient:
+        """
+        Return the shared client, creating it on first use.
+        
+        Returns:
+            The pooled HTTP client
+        """
+        if self.client is None or self.client.is_closed:
+            async with self._lock:
+                if self.client is None or self.client.is_closed:
+                    self.client = httpx.AsyncClient(
+                        http2=True,
+                        timeout=HTTP_TIMEOUT,
+                        limits=HTTP_LIMITS,
+                    )
+        
+        return self.client
+    
+    async def disconnect(self) -> None:
+        """Close all pooled connections."""
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+
+
+http_client = HTTPClient()
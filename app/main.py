@@ -1,33 +1,61 @@
 """FastAPI application entry point."""
 
 import asyncio
+import random
+import time
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import HTMLResponse
 from fastapi.openapi.utils import get_openapi
 
 from app.api.routes import prices, wallets
 from app.cache import cache
 from app.config import get_settings
 from app.core.logging import logger
+from app.core.orjson_response import ORJSONResponse
 from app.core.response import error_response
 from app.database import db
-from app.exceptions import BlockAiException
+from app.exceptions import BlockAiException, ExternalAPIError
+from app.http_client import http_client
 from app.services.price_service import price_service
 
 
+# Background price refresh tuning
+PRICE_REFRESH_INTERVAL_SECONDS = 30
+PRICE_REFRESH_JITTER_SECONDS = 3
+PRICE_REFRESH_MAX_BACKOFF_SECONDS = 300
+PRICE_IDLE_TIMEOUT_SECONDS = 300
+
+
 async def update_rates_loop():
-    """Background task to update all prices every 30 seconds."""
+    """
+    Background task to refresh prices roughly every 30 seconds.
+    
+    Refreshes are skipped while no request has read prices recently,
+    and back off exponentially while the refresh keeps failing.
+    """
+    delay = PRICE_REFRESH_INTERVAL_SECONDS
     while True:
+        jitter = random.uniform(-PRICE_REFRESH_JITTER_SECONDS, PRICE_REFRESH_JITTER_SECONDS)
+        await asyncio.sleep(delay + jitter)
+        
+        if time.monotonic() - price_service.last_accessed > PRICE_IDLE_TIMEOUT_SECONDS:
+            delay = PRICE_REFRESH_INTERVAL_SECONDS
+            continue
+        
         try:
             logger.info("Background task: Refreshing prices...")
-            await price_service.get_all_prices()
+            await price_service.get_all_prices(refresh=True)
+            delay = PRICE_REFRESH_INTERVAL_SECONDS
+        except ExternalAPIError as e:
+            # Upstream is failing; poll less often until it recovers
+            delay = min(PRICE_REFRESH_MAX_BACKOFF_SECONDS, delay * 2)
+            logger.warning("Background price refresh failed, retrying in %ss: %s", delay, e)
         except Exception as e:
-            logger.error(f"Background task error: {e}")
-        
-        await asyncio.sleep(30)
+            logger.error("Background task error: %s", e)
+            delay = min(PRICE_REFRESH_MAX_BACKOFF_SECONDS, delay * 2)
 
 
 @asynccontextmanager
@@ -41,6 +69,8 @@ async def lifespan(app: FastAPI):
     await cache.connect()
     logger.info("Connected to Redis")
     
+    await http_client.connect()
+    
     # Initial price fetch
     await price_service.get_all_prices()
     task = asyncio.create_task(update_rates_loop())
@@ -54,6 +84,8 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
     
+    await http_client.disconnect()
+    
     await cache.disconnect()
     logger.info("Disconnected from Redis")
     
@@ -68,6 +100,7 @@ app = FastAPI(
     description="Multi-chain cryptocurrency portfolio tracker with support for Ethereum and Bitcoin",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url=None,       # Disable default Swagger UI
     redoc_url=None,      # Disable default ReDoc
 )
@@ -112,8 +145,8 @@ async def scalar_html():
 @app.exception_handler(BlockAiException)
 async def blockai_exception_handler(request: Request, exc: BlockAiException):
     """Global exception handler for application-specific errors."""
-    logger.error(f"BlockAiException: {exc.message}")
-    return JSONResponse(
+    logger.error("BlockAiException: %s", exc.message)
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=error_response(
             message="An error occurred",
@@ -125,8 +158,8 @@ async def blockai_exception_handler(request: Request, exc: BlockAiException):
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler for unexpected errors."""
-    logger.exception(f"Unexpected error: {str(exc)}")
-    return JSONResponse(
+    logger.exception("Unexpected error: %s", exc)
+    return ORJSONResponse(
         status_code=500,
         content=error_response(
             message="Internal server error",
@@ -4,8 +4,9 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from beanie import Document, Indexed
-from pydantic import Field
+import pymongo
+from beanie import Document, Indexed, PydanticObjectId
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class NetworkType(str, Enum):
@@ -23,7 +24,7 @@ class WalletModel(Document):
     address: Indexed(str, unique=True) = Field(..., description="Wallet address")
     public_key: str = Field(..., description="Public key")
     encrypted_private_key: str = Field(..., description="Encrypted private key")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Indexed(datetime, index_type=pymongo.DESCENDING) = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
     class Settings:
@@ -39,3 +40,14 @@ class WalletModel(Document):
                 "encrypted_private_key": "encrypted_data...",
             }
         }
+
+
+class WalletListProjection(BaseModel):
+    """Projection of the wallet fields needed for listings and balances."""
+    
+    model_config = ConfigDict(populate_by_name=True)
+    
+    id: PydanticObjectId = Field(..., alias="_id")
+    network: NetworkType
+    address: str
+    created_at: datetime
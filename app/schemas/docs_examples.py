@@ -0,0 +1,49 @@
+"""OpenAPI response examples, attached to routes via `responses=`."""
+
+from typing import Any, Dict
+
+
+PRICES_LIST_EXAMPLE = {
+    "btc": {"symbol": "BTC", "price_usd": 50000.00, "price_ngn": 75000000.00, "change_24h": 2.5},
+    "eth": {"symbol": "ETH", "price_usd": 2500.00, "price_ngn": 3750000.00, "change_24h": 1.8},
+    "bnb": {"symbol": "BNB", "price_usd": 300.00, "price_ngn": 450000.00, "change_24h": 1.2},
+    "matic": {"symbol": "MATIC", "price_usd": 0.80, "price_ngn": 1200.00, "change_24h": 3.1},
+    "usdt": {"symbol": "USDT", "price_usd": 1.00, "price_ngn": 1500.00, "change_24h": 0.01},
+    "usdc": {"symbol": "USDC", "price_usd": 1.00, "price_ngn": 1500.00, "change_24h": 0.01}
+}
+
+WALLET_EXAMPLE = {
+    "id": "507f1f77bcf86cd799439011",
+    "network": "ethereum",
+    "address": "0x742d35Cc6634C0532925a3b844Bc9e7595f...",
+    "created_at": "2024-01-15T10:30:00Z"
+}
+
+WALLET_BALANCE_EXAMPLE = {
+    "id": "507f1f77bcf86cd799439011",
+    "network": "ethereum",
+    "address": "0x742d35Cc6634C0532925a3b844Bc9e7595f...",
+    "asset": "ETH",
+    "balance": "1.5",
+    "balance_usd": 3750.00,
+    "balance_ngn": 5625000.00
+}
+
+PORTFOLIO_VALUE_EXAMPLE = {
+    "total_value_usd": 10000.00,
+    "total_value_ngn": 15000000.00,
+    "wallets": []
+}
+
+
+def success_example(message: str, data: Any) -> Dict[str, Any]:
+    """Build an OpenAPI content block showing a success response example."""
+    return {
+        "application/json": {
+            "example": {
+                "success": True,
+                "message": message,
+                "data": data,
+            }
+        }
+    }
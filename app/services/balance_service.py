@@ -1,14 +1,22 @@
 """Balance service for fetching blockchain balances via public RPCs."""
 
-from typing import Dict, List, Optional
+import asyncio
+import re
+import statistics
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple, TypeVar, Union
 from decimal import Decimal
 
 import httpx
+import orjson
 
 from app.cache import cache
 from app.core.logging import logger
-from app.exceptions import ExternalAPIError, BlockAiException
-from app.models.wallet import NetworkType, WalletModel
+from app.exceptions import ExternalAPIError, BlockAiException, InvalidAddressError
+from app.http_client import http_client
+from app.models.wallet import NetworkType, WalletListProjection, WalletModel
 from app.schemas.wallet import PortfolioValueResponse, WalletBalanceResponse
 from app.services.price_service import price_service
 
@@ -29,6 +37,23 @@ NATIVE_ASSETS = {
     "bitcoin": "BTC",
 }
 
+_NETWORK_STR = {
+    NetworkType.ETHEREUM: "ethereum",
+    NetworkType.BSC: "bsc",
+    NetworkType.POLYGON: "polygon",
+    NetworkType.BITCOIN: "bitcoin",
+}
+_NATIVE_ASSET_SET = frozenset(NATIVE_ASSETS.values())
+_NATIVE_TO_NETWORK = {native: network for network, native in NATIVE_ASSETS.items()}
+
+# Native balance fetcher and asset symbol for each network
+_NATIVE_FETCHERS: Dict[NetworkType, Tuple[Callable[["BalanceService", str], Awaitable[Decimal]], str]] = {
+    NetworkType.BITCOIN: (lambda self, address: self._get_btc_balance(address), "BTC"),
+    NetworkType.ETHEREUM: (lambda self, address: self._get_evm_balance(address, "ethereum"), "ETH"),
+    NetworkType.BSC: (lambda self, address: self._get_evm_balance(address, "bsc"), "BNB"),
+    NetworkType.POLYGON: (lambda self, address: self._get_evm_balance(address, "polygon"), "MATIC"),
+}
+
 # Token Configuration
 TOKEN_CONFIG = {
     "ethereum": {
@@ -65,10 +90,254 @@ TOKEN_CONFIG = {
 
 BALANCE_OF_SELECTOR = "0x70a08231"
 
+# Satoshi (8) and wei (18) plus every configured token's decimals
+_DECIMAL_SCALES = {
+    decimals: Decimal(10) ** decimals
+    for decimals in {8, 18}.union(
+        token["decimals"] for tokens in TOKEN_CONFIG.values() for token in tokens.values()
+    )
+}
+
+# Tokens included alongside the native asset in portfolio views
+PORTFOLIO_TOKENS = ("USDT", "USDC")
+
+BALANCE_CACHE_TTL = 30
+
+# How long a failed balance fetch is remembered before it is retried
+ERROR_CACHE_TTL = 5
+
+# Maximum number of calls per JSON-RPC batch request
+RPC_MAX_BATCH_SIZE = 50
+
+# Cache writes in flight beyond this are awaited inline rather than queued
+MAX_BACKGROUND_CACHE_WRITES = 1000
+
+# Adaptive (AIMD) limits on in-flight requests per RPC endpoint
+RPC_CONCURRENCY_INITIAL = 10
+RPC_CONCURRENCY_MIN = 1
+RPC_CONCURRENCY_MAX = 64
+RPC_CONCURRENCY_INCREASE = 0.5
+RPC_CONCURRENCY_DECREASE = 0.5
+RPC_LATENCY_TARGET_SECONDS = 2.0
+RPC_LATENCY_WINDOW = 32
+RPC_LATENCY_SPIKE_FACTOR = 4.0
+RPC_MAX_RETRY_AFTER_SECONDS = 30.0
+
+T = TypeVar("T")
+
+
+def _balance_cache_key(network: str, address: str, token_symbol: Optional[str] = None) -> str:
+    """Build the cache key for a native or token balance."""
+    if token_symbol:
+        return f"balance:{network}:{token_symbol}:{address}"
+    return f"balance:{network}:{address}"
+
+
+def _error_cache_key(cache_key: str) -> str:
+    """Build the cache key marking a recently failed fetch of a balance."""
+    return f"err:{cache_key}"
+
+
+_EVM_ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
+
+def _balance_of_data(address: str) -> str:
+    """
+    Encode balanceOf(address) call data.
+    
+    Args:
+        address: 0x-prefixed EVM address
+        
+    Returns:
+        Hex call data with the address left-padded to 32 bytes
+        
+    Raises:
+        InvalidAddressError: If the address is not 20 bytes of hex
+    """
+    if not _EVM_ADDRESS_RE.fullmatch(address):
+        raise InvalidAddressError(address, "EVM")
+    
+    return f"{BALANCE_OF_SELECTOR}{address[2:].lower().zfill(64)}"
+
+
+def _decode_cached_balance(value: Any, decimals: int) -> Optional[Decimal]:
+    """
+    Scale a cached raw balance (wei, satoshi or token units) to asset units.
+    
+    Raw balances are cached as integer strings since wei amounts overflow
+    64-bit JSON integers; any other cached value is treated as a miss.
+    """
+    if not isinstance(value, str):
+        return None
+    return Decimal(value) / _DECIMAL_SCALES[decimals]
+
+
+def _hex_to_int(value: Optional[str]) -> int:
+    """Decode a JSON-RPC hex result; empty results ("0x" or missing) are zero."""
+    if not value or value == "0x":
+        return 0
+    return int(value, 16)
+
+
+class _ConcurrencyController:
+    """
+    Additive-increase/multiplicative-decrease limit on in-flight requests.
+    
+    The limit grows by a fixed step after every healthy response and is
+    cut by a constant factor on 429s, 5xx responses, transport errors and
+    latency spikes, at most once per latency target interval.
+    """
+    
+    def __init__(self) -> None:
+        self.limit = float(RPC_CONCURRENCY_INITIAL)
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        self._latencies: deque = deque(maxlen=RPC_LATENCY_WINDOW)
+        self._last_decrease = 0.0
+        self._blocked_until = 0.0
+    
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for a free request slot and hold it for the duration."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        
+        try:
+            wait = self._blocked_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+    
+    def _is_latency_spike(self, latency: float) -> bool:
+        """Check a latency against the target and the recent median."""
+        if latency > RPC_LATENCY_TARGET_SECONDS:
+            return True
+        if len(self._latencies) < RPC_LATENCY_WINDOW:
+            return False
+        return latency > RPC_LATENCY_SPIKE_FACTOR * statistics.median(self._latencies)
+    
+    def record(self, latency: float, response: Optional[httpx.Response] = None) -> None:
+        """
+        Adjust the limit after a request completes.
+        
+        Args:
+            latency: Request duration in seconds
+            response: The HTTP response, or None if the request failed
+        """
+        overloaded = response is None or self._is_latency_spike(latency)
+        
+        if response is not None:
+            self._latencies.append(latency)
+            
+            if response.status_code == 429 or response.status_code >= 500:
+                overloaded = True
+            
+            retry_after = response.headers.get("retry-after")
+            if retry_after and retry_after.isdigit():
+                pause = min(float(retry_after), RPC_MAX_RETRY_AFTER_SECONDS)
+                self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+            
+            if response.headers.get("x-ratelimit-remaining") == "0":
+                overloaded = True
+        
+        if overloaded:
+            now = time.monotonic()
+            if now - self._last_decrease >= RPC_LATENCY_TARGET_SECONDS:
+                self._last_decrease = now
+                self.limit = max(RPC_CONCURRENCY_MIN, self.limit * RPC_CONCURRENCY_DECREASE)
+        else:
+            self.limit = min(RPC_CONCURRENCY_MAX, self.limit + RPC_CONCURRENCY_INCREASE)
+
 
 class BalanceService:
     """Service class for blockchain balance operations via public RPCs."""
     
+    def __init__(self) -> None:
+        self._controllers = {network: _ConcurrencyController() for network in PUBLIC_RPC_URLS}
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._bg_tasks: Set[asyncio.Task] = set()
+    
+    async def _write_in_background(self, write: Awaitable[None]) -> None:
+        """
+        Run a cache write without holding up the caller.
+        
+        Args:
+            write: The cache write coroutine
+        """
+        if len(self._bg_tasks) >= MAX_BACKGROUND_CACHE_WRITES:
+            await write
+            return
+        
+        task = asyncio.ensure_future(write)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._finish_background_write)
+    
+    def _finish_background_write(self, task: asyncio.Task) -> None:
+        """Drop a finished cache write and log it if it failed."""
+        self._bg_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Background cache write failed: %s", task.exception())
+    
+    async def _single_flight(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fetch once per key at a time; concurrent callers share its result.
+        
+        The fetch runs as its own task so that a cancelled caller (e.g. a
+        dropped client connection) does not cancel it for the others.
+        
+        Args:
+            key: Identifies the fetch, typically its cache key
+            fetch: Factory for the coroutine doing the actual work
+            
+        Returns:
+            The fetch result
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_flight(key, done))
+        
+        return await asyncio.shield(task)
+    
+    def _finish_flight(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished fetch and mark its exception as retrieved."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+    
+    async def _send(self, network: str, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request to a network's RPC under its adaptive concurrency limit.
+        
+        Args:
+            network: Network name whose RPC endpoint is being called
+            method: HTTP method
+            url: Request URL
+            
+        Returns:
+            The HTTP response
+        """
+        controller = self._controllers[network]
+        client = await http_client.get_client()
+        
+        async with controller.slot():
+            start = time.monotonic()
+            try:
+                response = await client.request(method, url, **kwargs)
+            except httpx.HTTPError:
+                controller.record(time.monotonic() - start)
+                raise
+            controller.record(time.monotonic() - start, response)
+        
+        return response
+    
     def _get_rpc_url(self, network: str) -> str:
         """Get public RPC URL for a network."""
         url = PUBLIC_RPC_URLS.get(network)
@@ -78,27 +347,62 @@ class BalanceService:
     
     def _get_network_str(self, network: NetworkType) -> str:
         """Convert NetworkType enum to string for lookups."""
-        if network == NetworkType.ETHEREUM:
-            return "ethereum"
-        elif network == NetworkType.BSC:
-            return "bsc"
-        elif network == NetworkType.POLYGON:
-            return "polygon"
-        elif network == NetworkType.BITCOIN:
-            return "bitcoin"
-        return "unknown"
+        return _NETWORK_STR.get(network, "unknown")
     
     def _is_native_asset(self, asset: str) -> bool:
         """Check if an asset is a native currency of any chain."""
-        return asset.upper() in NATIVE_ASSETS.values()
+        return asset.upper() in _NATIVE_ASSET_SET
     
     def _get_native_asset_network(self, asset: str) -> Optional[str]:
         """Get the network name for a native asset."""
-        asset_upper = asset.upper()
-        for network, native in NATIVE_ASSETS.items():
-            if native == asset_upper:
-                return network
-        return None
+        return _NATIVE_TO_NETWORK.get(asset.upper())
+
+    async def _read_cached(self, cache_key: str, cached: Optional[Dict[str, Any]]) -> Tuple[Optional[Any], bool]:
+        """
+        Read a balance and its recent-failure marker.
+        
+        Args:
+            cache_key: Balance cache key
+            cached: Pre-fetched cache values; read from cache when None
+            
+        Returns:
+            Tuple of (cached value or None, whether the last fetch failed recently)
+        """
+        error_key = _error_cache_key(cache_key)
+        if cached is not None:
+            return cached.get(cache_key), bool(cached.get(error_key))
+        
+        value, failed = await cache.mget([cache_key, error_key])
+        return value, bool(failed)
+    
+    async def _fetch_uncached(self, cache_key: str, fetch: Callable[[], Awaitable[Decimal]]) -> Decimal:
+        """
+        Fetch a balance once per key at a time, briefly remembering failures.
+        
+        Args:
+            cache_key: Balance cache key
+            fetch: Factory for the coroutine doing the upstream request
+            
+        Returns:
+            The fetched balance
+        """
+        async def guarded() -> Decimal:
+            try:
+                return await fetch()
+            except ExternalAPIError:
+                await self._write_in_background(
+                    cache.set(_error_cache_key(cache_key), True, ttl=ERROR_CACHE_TTL)
+                )
+                raise
+        
+        return await self._single_flight(cache_key, guarded)
+    
+    async def _write_cached(self, cache_key: str, value: Any, writes: Optional[Dict[str, Any]]) -> None:
+        """Queue a balance for a batched cache write if collecting, else set it."""
+        if writes is not None:
+            writes[cache_key] = value
+        else:
+            await self._write_in_background(cache.set(cache_key, value, ttl=BALANCE_CACHE_TTL))
 
     async def _get_token_balance(self, address: str, network: str, token_symbol: str) -> Decimal:
         """
@@ -124,18 +428,23 @@ class BalanceService:
         
         rpc_url = self._get_rpc_url(network)
         
-        cache_key = f"balance:{network}:{token_symbol}:{address}"
-        cached = await cache.get(cache_key)
-        if cached is not None:
-             return Decimal(str(cached))
+        cache_key = _balance_cache_key(network, address, token_symbol)
+        value, failed = await self._read_cached(cache_key, None)
+        balance = _decode_cached_balance(value, decimals)
+        if balance is not None:
+            return balance
+        if failed:
+            raise ExternalAPIError("RPC", f"{token_symbol} balance on {network} failed recently")
 
-        data_payload = f"{BALANCE_OF_SELECTOR}{address[2:].zfill(64)}"
+        data_payload = _balance_of_data(address)
         
-        try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.post(
+        async def fetch() -> Decimal:
+            try:
+                response = await self._send(
+                    network,
+                    "POST",
                     rpc_url,
-                    json={
+                    content=orjson.dumps({
                         "jsonrpc": "2.0",
                         "id": 1,
                         "method": "eth_call",
@@ -146,32 +455,32 @@ class BalanceService:
                             },
                             "latest"
                         ]
-                    },
+                    }),
                     headers={"Content-Type": "application/json"}
                 )
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 if "error" in data:
                     error_msg = data["error"].get("message", str(data["error"]))
-                    logger.warning(f"RPC token error on {network}: {error_msg}")
+                    logger.warning("RPC token error on %s: %s", network, error_msg)
                     raise ExternalAPIError("RPC", error_msg)
                 
-                result_hex = data.get("result", "0x0")
-                if result_hex == "0x" or result_hex is None:
-                    result_hex = "0x0"
-                    
-                balance_raw = int(result_hex, 16)
-                balance = Decimal(balance_raw) / Decimal(10 ** decimals)
+                balance_raw = _hex_to_int(data.get("result"))
+                balance = Decimal(balance_raw) / _DECIMAL_SCALES[decimals]
                 
-                await cache.set(cache_key, float(balance), ttl=30)
+                await self._write_in_background(
+                    cache.set(cache_key, str(balance_raw), ttl=BALANCE_CACHE_TTL)
+                )
                 
                 return balance
                 
-        except httpx.HTTPError as e:
-            error_msg = f"HTTP error fetching {token_symbol} on {network}: {str(e)}"
-            logger.error(error_msg)
-            raise ExternalAPIError("RPC", error_msg)
+            except httpx.HTTPError as e:
+                error_msg = f"HTTP error fetching {token_symbol} on {network}: {str(e)}"
+                logger.error(error_msg)
+                raise ExternalAPIError("RPC", error_msg)
+        
+        return await self._fetch_uncached(cache_key, fetch)
 
     async def _get_evm_balance(self, address: str, network: str) -> Decimal:
         """
@@ -186,25 +495,30 @@ class BalanceService:
         """
         rpc_url = self._get_rpc_url(network)
         
-        cache_key = f"balance:{network}:{address}"
-        cached = await cache.get(cache_key)
-        if cached:
-            return Decimal(str(cached))
+        cache_key = _balance_cache_key(network, address)
+        value, failed = await self._read_cached(cache_key, None)
+        balance = _decode_cached_balance(value, 18)
+        if balance is not None:
+            return balance
+        if failed:
+            raise ExternalAPIError("RPC", f"{network} balance failed recently")
         
-        try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.post(
+        async def fetch() -> Decimal:
+            try:
+                response = await self._send(
+                    network,
+                    "POST",
                     rpc_url,
-                    json={
+                    content=orjson.dumps({
                         "jsonrpc": "2.0",
                         "id": 1,
                         "method": "eth_getBalance",
                         "params": [address, "latest"]
-                    },
+                    }),
                     headers={"Content-Type": "application/json"}
                 )
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 if "error" in data:
                     error_msg = data["error"].get("message", str(data["error"]))
@@ -214,39 +528,55 @@ class BalanceService:
                 if not result:
                     raise ExternalAPIError("RPC", "No result in RPC response")
                 
-                balance_wei = int(result, 16)
-                balance = Decimal(balance_wei) / Decimal(10 ** 18)
+                balance_wei = _hex_to_int(result)
+                balance = Decimal(balance_wei) / _DECIMAL_SCALES[18]
                 
-                await cache.set(cache_key, float(balance), ttl=30)
+                await self._write_in_background(
+                    cache.set(cache_key, str(balance_wei), ttl=BALANCE_CACHE_TTL)
+                )
                 
                 return balance
-        except httpx.HTTPError as e:
-            error_msg = f"HTTP error fetching {network} balance: {str(e)}"
-            logger.error(error_msg)
-            raise ExternalAPIError("RPC", error_msg)
+            except httpx.HTTPError as e:
+                error_msg = f"HTTP error fetching {network} balance: {str(e)}"
+                logger.error(error_msg)
+                raise ExternalAPIError("RPC", error_msg)
+        
+        return await self._fetch_uncached(cache_key, fetch)
     
-    async def _get_btc_balance(self, address: str) -> Decimal:
+    async def _get_btc_balance(
+        self,
+        address: str,
+        cached: Optional[Dict[str, Any]] = None,
+        writes: Optional[Dict[str, Any]] = None,
+    ) -> Decimal:
         """
         Fetch Bitcoin balance using Blockstream API.
         
         Args:
             address: Bitcoin address
+            cached: Pre-fetched cache values; skips the cache read when given
+            writes: Collects cache writes for a later batched set when given
             
         Returns:
             Balance in BTC
         """
-        cache_key = f"balance:bitcoin:{address}"
-        cached = await cache.get(cache_key)
-        if cached:
-            return Decimal(str(cached))
+        cache_key = _balance_cache_key("bitcoin", address)
+        value, failed = await self._read_cached(cache_key, cached)
+        balance = _decode_cached_balance(value, 8)
+        if balance is not None:
+            return balance
+        if failed:
+            raise ExternalAPIError("Blockstream", "BTC balance failed recently")
         
-        try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(
-                    f"{PUBLIC_RPC_URLS['bitcoin']}/address/{address}"
+        async def fetch() -> Decimal:
+            try:
+                response = await self._send(
+                    "bitcoin",
+                    "GET",
+                    f"{PUBLIC_RPC_URLS['bitcoin']}/address/{address}",
                 )
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 chain = data.get("chain_stats", {})
                 mempool = data.get("mempool_stats", {})
@@ -255,23 +585,235 @@ class BalanceService:
                 spent = chain.get("spent_txo_sum", 0) + mempool.get("spent_txo_sum", 0)
                 balance_satoshi = funded - spent
                 
-                balance = Decimal(balance_satoshi) / Decimal(100_000_000)
+                balance = Decimal(balance_satoshi) / _DECIMAL_SCALES[8]
                 
-                await cache.set(cache_key, float(balance), ttl=30)
+                await self._write_cached(cache_key, str(balance_satoshi), writes)
                 
                 return balance
+            except httpx.HTTPError as e:
+                error_msg = f"HTTP error fetching BTC balance: {str(e)}"
+                logger.error(error_msg)
+                raise ExternalAPIError("Blockstream", error_msg)
+        
+        return await self._fetch_uncached(cache_key, fetch)
+    
+    async def _post_rpc_batch(self, network: str, calls: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        POST calls as one JSON-RPC batch request.
+        
+        Args:
+            network: Network name
+            calls: JSON-RPC call objects with method and params
+            
+        Returns:
+            Each call's hex result in order, None where the call failed
+        """
+        rpc_url = self._get_rpc_url(network)
+        
+        try:
+            response = await self._send(
+                network,
+                "POST",
+                rpc_url,
+                content=orjson.dumps([
+                    {"jsonrpc": "2.0", "id": req_id, **call}
+                    for req_id, call in enumerate(calls)
+                ]),
+                headers={"Content-Type": "application/json"}
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
         except httpx.HTTPError as e:
-            error_msg = f"HTTP error fetching BTC balance: {str(e)}"
+            error_msg = f"HTTP error sending RPC batch on {network}: {str(e)}"
             logger.error(error_msg)
-            raise ExternalAPIError("Blockstream", error_msg)
+            raise ExternalAPIError("RPC", error_msg)
+        
+        if not isinstance(data, list):
+            error = data.get("error", data) if isinstance(data, dict) else data
+            raise ExternalAPIError("RPC", f"Batch request rejected on {network}: {error}")
+        
+        entries = {entry.get("id"): entry for entry in data if isinstance(entry, dict)}
+        
+        results: List[Optional[str]] = []
+        for req_id, call in enumerate(calls):
+            entry = entries.get(req_id)
+            if entry is None or "error" in entry:
+                error = entry.get("error") if entry else "missing response"
+                logger.warning("RPC batch error for %s on %s: %s", call["method"], network, error)
+                results.append(None)
+                continue
+            
+            results.append(entry.get("result") or "0x0")
+        
+        return results
     
-    async def get_wallet_balance(self, wallet: WalletModel, asset: Optional[str] = None) -> WalletBalanceResponse:
+    async def _execute_rpc_batch(self, network: str, calls: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Run calls against a network's RPC in as few batch requests as possible.
+        
+        Args:
+            network: Network name
+            calls: JSON-RPC call objects with method and params
+            
+        Returns:
+            Each call's hex result in order, None where the call failed
+        """
+        chunks = [
+            calls[start:start + RPC_MAX_BATCH_SIZE]
+            for start in range(0, len(calls), RPC_MAX_BATCH_SIZE)
+        ]
+        responses = await asyncio.gather(
+            *(self._post_rpc_batch(network, chunk) for chunk in chunks),
+            return_exceptions=True
+        )
+        
+        results: List[Optional[str]] = []
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, Exception):
+                logger.error("RPC batch failed on %s: %s", network, response)
+                results.extend([None] * len(chunk))
+            else:
+                results.extend(response)
+        
+        return results
+    
+    async def _get_evm_network_balances(
+        self,
+        network: str,
+        addresses: List[str],
+        tokens: List[str],
+        cached: Dict[str, Any],
+        writes: Dict[str, Any],
+    ) -> Dict[str, Dict[str, Decimal]]:
+        """
+        Fetch native and token balances for many wallets on one EVM network.
+        
+        Every uncached balance across all addresses goes into the same
+        JSON-RPC batch, so a portfolio costs one request per network. A
+        malformed address still gets its native balance fetched, but its
+        token calls are skipped since they embed the address in call data.
+        
+        Args:
+            network: Network name
+            addresses: Wallet addresses on the network
+            tokens: Token symbols to fetch alongside the native balance
+            cached: Pre-fetched cache values
+            writes: Collects cache writes for a later batched set
+            
+        Returns:
+            Balances keyed by address then asset symbol; failed calls are omitted
+        """
+        native = NATIVE_ASSETS[network]
+        balances: Dict[str, Dict[str, Decimal]] = {address: {} for address in addresses}
+        
+        # (address, symbol, decimals, cache_key) for each entry in calls
+        pending = []
+        calls: List[Dict[str, Any]] = []
+        
+        for address in balances:
+            try:
+                call_data = _balance_of_data(address)
+            except InvalidAddressError:
+                logger.warning("Skipping token balances for malformed %s address %s", network, address)
+                call_data = None
+            
+            cache_key = _balance_cache_key(network, address)
+            balance = _decode_cached_balance(cached.get(cache_key), 18)
+            if balance is not None:
+                balances[address][native] = balance
+            elif not cached.get(_error_cache_key(cache_key)):
+                pending.append((address, native, 18, cache_key))
+                calls.append({
+                    "method": "eth_getBalance",
+                    "params": [address, "latest"],
+                })
+            
+            if call_data is None:
+                continue
+            
+            for token_symbol in tokens:
+                token_info = TOKEN_CONFIG[network][token_symbol.lower()]
+                cache_key = _balance_cache_key(network, address, token_symbol)
+                balance = _decode_cached_balance(cached.get(cache_key), token_info["decimals"])
+                if balance is not None:
+                    balances[address][token_symbol] = balance
+                    continue
+                if cached.get(_error_cache_key(cache_key)):
+                    continue
+                
+                pending.append((address, token_symbol, token_info["decimals"], cache_key))
+                calls.append({
+                    "method": "eth_call",
+                    "params": [
+                        {
+                            "to": token_info["address"],
+                            "data": call_data
+                        },
+                        "latest"
+                    ],
+                })
+        
+        if not calls:
+            return balances
+        
+        # Identical concurrent portfolio requests share one batch
+        batch_key = ("batch", network, tuple(cache_key for *_, cache_key in pending))
+        results = await self._single_flight(
+            batch_key, lambda: self._execute_rpc_batch(network, calls)
+        )
+        
+        failures: Dict[str, Any] = {}
+        for (address, symbol, decimals, cache_key), result_hex in zip(pending, results):
+            if result_hex is None:
+                failures[_error_cache_key(cache_key)] = True
+                continue
+            
+            balance_raw = _hex_to_int(result_hex)
+            balances[address][symbol] = Decimal(balance_raw) / _DECIMAL_SCALES[decimals]
+            writes[cache_key] = str(balance_raw)
+        
+        if failures:
+            await self._write_in_background(cache.mset(failures, ttl=ERROR_CACHE_TTL))
+        
+        return balances
+    
+    def _build_balance_response(
+        self,
+        wallet: Union[WalletModel, WalletListProjection],
+        symbol: str,
+        balance: Decimal,
+        price_usd: float,
+        ngn_rate: float,
+    ) -> WalletBalanceResponse:
+        """Convert a raw balance into a response with USD and NGN values."""
+        balance_usd = float(balance) * price_usd
+        balance_ngn = balance_usd * ngn_rate
+        
+        return WalletBalanceResponse(
+            id=str(wallet.id),
+            network=wallet.network,
+            address=wallet.address,
+            asset=symbol,
+            balance=str(balance),
+            balance_usd=round(balance_usd, 2),
+            balance_ngn=round(balance_ngn, 2),
+        )
+    
+    async def get_wallet_balance(
+        self,
+        wallet: Union[WalletModel, WalletListProjection],
+        asset: Optional[str] = None,
+        prices: Optional[Dict[str, float]] = None,
+        ngn_rate: Optional[float] = None,
+    ) -> WalletBalanceResponse:
         """
         Get balance for a wallet with USD and NGN conversion.
         
         Args:
-            wallet: Wallet model
+            wallet: Wallet model or projection
             asset: Optional asset symbol (e.g. USDT) to fetch instead of native
+            prices: Pre-fetched USD prices by symbol; looked up when omitted
+            ngn_rate: Pre-fetched USD to NGN rate; looked up when omitted
             
         Returns:
             Wallet balance response with currency conversions
@@ -292,20 +834,12 @@ class BalanceService:
                     status_code=400
                 )
             
-            if network == NetworkType.BITCOIN:
-                balance = await self._get_btc_balance(wallet.address)
-                symbol = "BTC"
-            elif network == NetworkType.ETHEREUM:
-                balance = await self._get_evm_balance(wallet.address, "ethereum")
-                symbol = "ETH"
-            elif network == NetworkType.BSC:
-                balance = await self._get_evm_balance(wallet.address, "bsc")
-                symbol = "BNB"
-            elif network == NetworkType.POLYGON:
-                balance = await self._get_evm_balance(wallet.address, "polygon")
-                symbol = "MATIC"
+            native_fetcher = _NATIVE_FETCHERS.get(network)
+            if native_fetcher:
+                fetch, symbol = native_fetcher
+                balance_coro = fetch(self, wallet.address)
             else:
-                balance = Decimal(0)
+                balance_coro = asyncio.sleep(0, result=Decimal(0))
                 symbol = "UNKNOWN"
         else:
             if network == NetworkType.BITCOIN:
@@ -320,66 +854,107 @@ class BalanceService:
                     status_code=400
                 )
 
-            balance = await self._get_token_balance(wallet.address, network_str, target_asset)
+            balance_coro = self._get_token_balance(wallet.address, network_str, target_asset)
             symbol = target_asset
         
-        price_usd = await price_service.get_price_for_symbol(symbol)
-        ngn_rate = await price_service.get_ngn_rate()
-        
-        balance_usd = float(balance) * price_usd
-        balance_ngn = balance_usd * ngn_rate
+        # The balance RPC and the price lookups are independent; overlap them
+        if prices is not None and ngn_rate is not None:
+            balance = await balance_coro
+            price_usd = prices.get(symbol, 0.0)
+        else:
+            balance, price_usd, ngn_rate = await asyncio.gather(
+                balance_coro,
+                price_service.get_price_for_symbol(symbol),
+                price_service.get_ngn_rate(),
+            )
         
-        return WalletBalanceResponse(
-            id=str(wallet.id),
-            network=wallet.network,
-            address=wallet.address,
-            asset=symbol,
-            balance=str(balance),
-            balance_usd=round(balance_usd, 2),
-            balance_ngn=round(balance_ngn, 2),
-        )
+        return self._build_balance_response(wallet, symbol, balance, price_usd, ngn_rate)
+    
+    def _portfolio_symbols(self, network: str) -> List[str]:
+        """List the assets the portfolio view reports for a network."""
+        if network == "bitcoin":
+            return ["BTC"]
+        return [NATIVE_ASSETS[network], *PORTFOLIO_TOKENS]
+    
+    def _portfolio_cache_keys(self, wallet: WalletListProjection) -> List[str]:
+        """List the balance cache keys the portfolio view reads for a wallet."""
+        network_str = self._get_network_str(wallet.network)
+        keys = [_balance_cache_key(network_str, wallet.address)]
+        if wallet.network != NetworkType.BITCOIN:
+            keys.extend(
+                _balance_cache_key(network_str, wallet.address, token_symbol)
+                for token_symbol in PORTFOLIO_TOKENS
+            )
+        # Recent-failure markers ride along so failing lookups are not retried yet
+        return keys + [_error_cache_key(key) for key in keys]
     
-    async def get_portfolio_value(self, wallets: List[WalletModel]) -> PortfolioValueResponse:
+    async def _get_btc_balances(
+        self,
+        address: str,
+        cached: Dict[str, Any],
+        writes: Dict[str, Any],
+    ) -> Dict[str, Dict[str, Decimal]]:
+        """Fetch a Bitcoin wallet's balance in the per-network result shape."""
+        return {address: {"BTC": await self._get_btc_balance(address, cached, writes)}}
+    
+    async def get_portfolio_value(self, wallets: List[WalletListProjection]) -> PortfolioValueResponse:
         """Calculate total portfolio value across all wallets."""
-        import asyncio
+        # Read every cached balance in one round-trip and write misses back in one
+        keys = [key for w in wallets for key in self._portfolio_cache_keys(w)]
+        cached = dict(zip(keys, await cache.mget(keys))) if keys else {}
+        writes: Dict[str, Any] = {}
+        
+        # Resolve prices once for the whole portfolio rather than per asset
+        prices, ngn_rate = await asyncio.gather(
+            price_service.get_usd_prices(),
+            price_service.get_ngn_rate(),
+        )
         
-        async def fetch_wallet_balances(wallet: WalletModel) -> List[WalletBalanceResponse]:
-            results = []
+        # Group EVM wallets by network so each RPC endpoint gets one batched request;
+        # Blockstream has no batch API, so Bitcoin wallets are fetched one by one
+        evm_addresses: Dict[str, List[str]] = {}
+        tasks = []
+        for wallet in wallets:
             network_str = self._get_network_str(wallet.network)
-            
-            # Build list of tasks for this wallet
-            tasks = [self.get_wallet_balance(wallet)]  # Native
-            
-            if wallet.network != NetworkType.BITCOIN:
-                tasks.append(self.get_wallet_balance(wallet, asset="USDT"))
-                tasks.append(self.get_wallet_balance(wallet, asset="USDC"))
-            
-            responses = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for resp in responses:
-                if isinstance(resp, Exception):
-                    logger.error(f"Balance fetch error for wallet {wallet.id}: {resp}")
-                    continue
-                if float(resp.balance) > 0 or resp.asset in ["ETH", "BTC", "BNB", "MATIC"]:
-                    results.append(resp)
-            
-            return results
+            if wallet.network == NetworkType.BITCOIN:
+                tasks.append(("bitcoin", self._get_btc_balances(wallet.address, cached, writes)))
+            else:
+                evm_addresses.setdefault(network_str, []).append(wallet.address)
         
-        # Fetch all wallets in parallel
-        all_results = await asyncio.gather(
-            *[fetch_wallet_balances(w) for w in wallets],
-            return_exceptions=True
-        )
+        for network_str, addresses in evm_addresses.items():
+            tasks.append((network_str, self._get_evm_network_balances(
+                network_str, addresses, PORTFOLIO_TOKENS, cached, writes
+            )))
+        
+        all_results = await asyncio.gather(*(coro for _, coro in tasks), return_exceptions=True)
+        
+        if writes:
+            await self._write_in_background(cache.mset(writes, ttl=BALANCE_CACHE_TTL))
+        
+        fetched: Dict[str, Dict[str, Dict[str, Decimal]]] = {}
+        for (network_str, _), result in zip(tasks, all_results):
+            if isinstance(result, Exception):
+                logger.error("Portfolio fetch error on %s: %s", network_str, result)
+                continue
+            fetched.setdefault(network_str, {}).update(result)
         
         wallet_balances = []
         total_usd = 0.0
         total_ngn = 0.0
         
-        for result in all_results:
-            if isinstance(result, Exception):
-                logger.error(f"Portfolio fetch error: {result}")
-                continue
-            for balance in result:
+        for wallet in wallets:
+            network_str = self._get_network_str(wallet.network)
+            balances = fetched.get(network_str, {}).get(wallet.address, {})
+            
+            for symbol in self._portfolio_symbols(network_str):
+                amount = balances.get(symbol)
+                # Native balances are always listed; empty token balances are skipped
+                if amount is None or (not amount and symbol not in _NATIVE_ASSET_SET):
+                    continue
+                
+                balance = self._build_balance_response(
+                    wallet, symbol, amount, prices.get(symbol, 0.0), ngn_rate
+                )
                 wallet_balances.append(balance)
                 total_usd += balance.balance_usd
                 total_ngn += balance.balance_ngn
@@ -1,12 +1,16 @@
 """Price service for fetching cryptocurrency prices."""
 
-from typing import Dict, Any, List
+import time
+from typing import Dict, Any, List, Optional, Tuple
 
 import httpx
+import orjson
 
 from app.cache import cache
 from app.core.logging import logger
+from app.core.response import compute_etag, success_bytes
 from app.exceptions import ExternalAPIError
+from app.http_client import http_client
 from app.schemas.price import AssetPriceResponse, PricesListResponse
 
 
@@ -18,84 +22,160 @@ CACHE_KEY_NGN_RATE = "crypto:ngn_rate"
 
 REQUIRED_SYMBOLS = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "MATICUSDT", "USDCUSDT"]
 
+# Binance expects a compact JSON array, e.g. ["BTCUSDT","ETHUSDT"]
+BINANCE_SYMBOLS_PARAM = orjson.dumps(REQUIRED_SYMBOLS).decode()
+
+PRICES_MESSAGE = "Prices retrieved successfully"
+
+PRICES_CACHE_TTL_SECONDS = 30
+
+# Maximum age of the pre-serialized prices response before it is rebuilt
+PRICES_SNAPSHOT_MAX_AGE_SECONDS = 30
+
 
 class PriceService:
     
+    def __init__(self) -> None:
+        self._prices_data: Optional[Dict[str, Any]] = None
+        self._prices_json: bytes = b""
+        self._prices_etag: str = ""
+        self._prices_json_at: float = 0.0
+        self.last_accessed: float = time.monotonic()
+        self._binance_symbols_param: str = BINANCE_SYMBOLS_PARAM
+    
+    def _update_snapshot(self, data: Dict[str, Any]) -> None:
+        """Rebuild the pre-serialized prices response when the data changes."""
+        self._prices_json_at = time.monotonic()
+        if data is self._prices_data or data == self._prices_data:
+            return
+        
+        self._prices_data = data
+        self._prices_json = success_bytes(PRICES_MESSAGE, orjson.dumps(data))
+        self._prices_etag = compute_etag(self._prices_json)
+    
     async def get_all_binance_tickers(self) -> Dict[str, Dict[str, Any]]:
-        """Fetch all tickers from Binance and filter the ones we need."""
+        """Fetch 24h tickers from Binance for the symbols we need."""
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
+            client = await http_client.get_client()
+            response = await client.get(
+                f"{BINANCE_API_URL}/ticker/24hr",
+                params={"symbols": self._binance_symbols_param},
+            )
+            rejected = response.status_code == 400
+            if rejected:
+                # A single delisted symbol fails the whole filtered request
+                logger.warning("Binance rejected symbol filter, fetching all tickers: %s", response.text)
                 response = await client.get(f"{BINANCE_API_URL}/ticker/24hr")
-                response.raise_for_status()
-                data = response.json()
-                
-                result = {}
-                for ticker in data:
-                    symbol = ticker["symbol"]
-                    if symbol in REQUIRED_SYMBOLS:
-                        result[symbol] = {
-                            "price": float(ticker["lastPrice"]),
-                            "change_24h": float(ticker["priceChangePercent"]),
-                        }
-                
-                return result
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            
+            tickers = {
+                ticker["symbol"]: {
+                    "price": float(ticker["lastPrice"]),
+                    "change_24h": float(ticker["priceChangePercent"]),
+                }
+                for ticker in data
+                if ticker["symbol"] in REQUIRED_SYMBOLS
+            }
+            
+            # Filter by the symbols Binance actually lists from now on
+            listed = [symbol for symbol in REQUIRED_SYMBOLS if symbol in tickers]
+            if rejected and listed:
+                self._binance_symbols_param = orjson.dumps(listed).decode()
+            
+            return tickers
         except httpx.HTTPError as e:
-            logger.error(f"Binance API error: {e}")
+            logger.error("Binance API error: %s", e)
             raise ExternalAPIError("Binance", str(e))
     
     async def get_quidax_ticker(self, market: str) -> Dict[str, Any]:
         """Fetch ticker data from Quidax."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{QUIDAX_API_URL}/markets/tickers/{market}")
-                response.raise_for_status()
-                data = response.json()
-                
-                if data.get("status") == "error":
-                    raise ExternalAPIError("Quidax", data.get("message", "Unknown error"))
-                
-                ticker = data["data"]["ticker"]
-                return {
-                    "buy": float(ticker["buy"]),
-                    "sell": float(ticker["sell"]),
-                    "last": float(ticker["last"]),
-                }
+            client = await http_client.get_client()
+            response = await client.get(
+                f"{QUIDAX_API_URL}/markets/tickers/{market}",
+                timeout=10.0,
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            
+            if data.get("status") == "error":
+                raise ExternalAPIError("Quidax", data.get("message", "Unknown error"))
+            
+            ticker = data["data"]["ticker"]
+            return {
+                "buy": float(ticker["buy"]),
+                "sell": float(ticker["sell"]),
+                "last": float(ticker["last"]),
+            }
         except httpx.HTTPError as e:
-            logger.error(f"Quidax API error for {market}: {e}")
+            logger.error("Quidax API error for %s: %s", market, e)
             raise ExternalAPIError("Quidax", str(e))
         except (KeyError, ValueError) as e:
-            logger.error(f"Quidax response parsing error: {e}")
+            logger.error("Quidax response parsing error: %s", e)
             raise ExternalAPIError("Quidax", f"Invalid response: {e}")
     
-    async def get_ngn_rate(self) -> float:
-        """Fetch USD to NGN exchange rate."""
-        cached_rate = await cache.get(CACHE_KEY_NGN_RATE)
+    async def get_ngn_rate(self, fallback: bool = True) -> float:
+        """
+        Fetch USD to NGN exchange rate.
+        
+        Args:
+            fallback: Return a default rate instead of raising if Quidax fails
+            
+        Returns:
+            NGN per USD
+        """
+        cached_rate = await cache.get(CACHE_KEY_NGN_RATE, local=True)
         if cached_rate:
             return cached_rate
         
         try:
             ticker = await self.get_quidax_ticker("usdtngn")
             rate = ticker["last"]
-            await cache.set(CACHE_KEY_NGN_RATE, rate, ttl=300)
+            await cache.set(CACHE_KEY_NGN_RATE, rate, ttl=300, local=True)
             return rate
         except ExternalAPIError:
+            if not fallback:
+                raise
             logger.warning("Quidax unavailable, using fallback NGN rate")
             return 1500.0
     
-    async def get_all_prices(self) -> PricesListResponse:
-        """Fetch all crypto prices with NGN conversion."""
-        cached = await cache.get(CACHE_KEY_PRICES)
-        if cached:
-            return PricesListResponse(**cached)
+    async def get_all_prices(self, refresh: bool = False) -> PricesListResponse:
+        """
+        Fetch all crypto prices with NGN conversion.
+        
+        Args:
+            refresh: Skip the cached value and fetch from the upstream APIs
+            
+        Returns:
+            Prices for all supported assets
+            
+        Raises:
+            ExternalAPIError: On refresh, if Binance or Quidax fails; cached prices are kept
+        """
+        if not refresh:
+            # Any request-path read keeps the background refresh active
+            self.last_accessed = time.monotonic()
+            cached = await cache.get(CACHE_KEY_PRICES, local=True)
+            if cached:
+                self._update_snapshot(cached)
+                return PricesListResponse(**cached)
         
         logger.info("Fetching prices from Binance...")
         
         try:
             tickers = await self.get_all_binance_tickers()
         except ExternalAPIError as e:
-            logger.error(f"Failed to fetch Binance tickers: {e}")
+            logger.error("Failed to fetch Binance tickers: %s", e)
+            # A refresh must not replace good cached prices with zeros
+            if refresh:
+                raise
             tickers = {}
         
+        missing = [symbol for symbol in REQUIRED_SYMBOLS if symbol not in tickers]
+        if tickers and missing:
+            logger.warning("Binance returned no ticker for %s, pricing at zero", ", ".join(missing))
+        
         prices = {
             "btc": tickers.get("BTCUSDT", {"price": 0.0, "change_24h": 0.0}),
             "eth": tickers.get("ETHUSDT", {"price": 0.0, "change_24h": 0.0}),
@@ -105,7 +185,7 @@ class PriceService:
             "usdt": {"price": 1.0, "change_24h": 0.0},
         }
         
-        ngn_rate = await self.get_ngn_rate()
+        ngn_rate = await self.get_ngn_rate(fallback=not refresh)
         
         def make_response(symbol: str, data: Dict[str, Any]) -> AssetPriceResponse:
             return AssetPriceResponse(
@@ -120,15 +200,31 @@ class PriceService:
             "eth": make_response("ETH", prices["eth"]),
             "bnb": make_response("BNB", prices["bnb"]),
             "matic": make_response("MATIC", prices["matic"]),
-            "usdc": make_response("USDC", prices["usdc"]),
             "usdt": make_response("USDT", prices["usdt"]),
+            "usdc": make_response("USDC", prices["usdc"]),
         }
         
         cache_data = {k: v.model_dump() for k, v in result.items()}
-        await cache.set(CACHE_KEY_PRICES, cache_data, ttl=30)
+        await cache.set(CACHE_KEY_PRICES, cache_data, ttl=PRICES_CACHE_TTL_SECONDS, local=True)
+        self._update_snapshot(cache_data)
         
         return PricesListResponse(**result)
     
+    async def get_prices_snapshot(self) -> Tuple[bytes, str]:
+        """
+        Get the prices success response as pre-serialized JSON bytes.
+        
+        The snapshot and its ETag are rebuilt whenever prices change, so
+        serving it costs no serialization or hashing per request.
+        
+        Returns:
+            Tuple containing (body, etag)
+        """
+        self.last_accessed = time.monotonic()
+        if time.monotonic() - self._prices_json_at > PRICES_SNAPSHOT_MAX_AGE_SECONDS:
+            await self.get_all_prices()
+        return self._prices_json, self._prices_etag
+    
     async def get_price_for_symbol(self, symbol: str) -> float:
         """Get USD price for a specific symbol."""
         prices = await self.get_all_prices()
@@ -139,6 +235,16 @@ class PriceService:
             return price_obj.price_usd
         
         return 0.0
+    
+    async def get_usd_prices(self) -> Dict[str, float]:
+        """
+        Get USD prices for all supported assets.
+        
+        Returns:
+            USD price keyed by upper-case asset symbol
+        """
+        prices = await self.get_all_prices()
+        return {asset.symbol: asset.price_usd for _, asset in prices}
 
 
 price_service = PriceService()
@@ -1,16 +1,24 @@
 """Wallet service for managing wallet operations."""
 
-from typing import List
+from typing import List, Union
 
+import pymongo
 from beanie import PydanticObjectId
 
+from app.cache import cache
 from app.core.logging import logger
 from app.exceptions import InvalidNetworkError, WalletNotFoundError
-from app.models.wallet import NetworkType, WalletModel
+from app.models.wallet import NetworkType, WalletListProjection, WalletModel
 from app.schemas.wallet import WalletResponse
-from app.utils.bitcoin import generate_bitcoin_wallet
-from app.utils.bitcoin import encrypt_private_key as encrypt_btc_key
-from app.utils.ethereum import encrypt_private_key, generate_ethereum_wallet
+
+
+CACHE_KEY_WALLETS = "wallets:all"
+WALLET_CACHE_TTL = 10
+
+
+def _wallet_cache_key(wallet_id: PydanticObjectId) -> str:
+    """Build the cache key for a single wallet record."""
+    return f"wallet:{wallet_id}"
 
 
 class WalletService:
@@ -26,12 +34,18 @@ class WalletService:
         Returns:
             The created wallet model
         """
-        logger.info(f"Generating new {network.value} wallet")
+        logger.info("Generating new %s wallet", network.value)
         
+        # Key generation pulls in web3/eth_account; import on first use only
         if network == NetworkType.BITCOIN:
+            from app.utils.bitcoin import encrypt_private_key as encrypt_btc_key
+            from app.utils.bitcoin import generate_bitcoin_wallet
+            
             address, public_key, private_key = generate_bitcoin_wallet()
             encrypted_key = encrypt_btc_key(private_key)
         elif network in (NetworkType.ETHEREUM, NetworkType.BSC, NetworkType.POLYGON):
+            from app.utils.ethereum import encrypt_private_key, generate_ethereum_wallet
+            
             address, public_key, private_key = generate_ethereum_wallet()
             encrypted_key = encrypt_private_key(private_key)
         else:
@@ -45,43 +59,72 @@ class WalletService:
         )
         
         await wallet.insert()
-        logger.info(f"Created wallet {wallet.id} with address {address}")
+        await cache.delete(CACHE_KEY_WALLETS)
+        logger.info("Created wallet %s with address %s", wallet.id, address)
         
         return wallet
     
-    async def get_wallet(self, wallet_id: str) -> WalletModel:
+    async def get_wallet(self, wallet_id: PydanticObjectId) -> WalletListProjection:
         """
         Retrieve a wallet by its ID.
         
+        Only the non-secret fields are fetched, so private key material is
+        never loaded or cached on this path.
+        
         Args:
             wallet_id: The wallet's MongoDB ID
             
         Returns:
-            The wallet model
+            The wallet projection
             
         Raises:
             WalletNotFoundError: If wallet doesn't exist
         """
-        try:
-            wallet = await WalletModel.get(PydanticObjectId(wallet_id))
-        except Exception:
-            raise WalletNotFoundError(wallet_id)
+        cache_key = _wallet_cache_key(wallet_id)
+        cached = await cache.get(cache_key)
+        if cached:
+            return WalletListProjection.model_validate(cached)
         
+        wallet = await WalletModel.find_one(
+            WalletModel.id == wallet_id,
+            projection_model=WalletListProjection,
+        )
         if not wallet:
-            raise WalletNotFoundError(wallet_id)
+            raise WalletNotFoundError(str(wallet_id))
+        
+        await cache.set(cache_key, wallet.model_dump(mode="json"), ttl=WALLET_CACHE_TTL)
         
         return wallet
     
-    async def get_all_wallets(self) -> List[WalletModel]:
+    async def get_all_wallets(self) -> List[WalletListProjection]:
         """
         Retrieve all wallets.
         
+        Wallets are returned oldest first, served by the created_at index.
+        Only the fields needed for listings and balances are fetched, so
+        private key material is never loaded on this path.
+        
         Returns:
-            List of all wallet models
+            List of wallet projections
         """
-        return await WalletModel.find_all().to_list()
+        cached = await cache.get(CACHE_KEY_WALLETS)
+        if cached is not None:
+            return [WalletListProjection.model_validate(w) for w in cached]
+        
+        wallets = await WalletModel.find_all(
+            sort=[("created_at", pymongo.ASCENDING)],
+            projection_model=WalletListProjection,
+            batch_size=200,
+        ).to_list()
+        await cache.set(
+            CACHE_KEY_WALLETS,
+            [w.model_dump(mode="json") for w in wallets],
+            ttl=WALLET_CACHE_TTL,
+        )
+        
+        return wallets
     
-    async def delete_wallet(self, wallet_id: str) -> bool:
+    async def delete_wallet(self, wallet_id: PydanticObjectId) -> bool:
         """
         Delete a wallet by its ID.
         
@@ -94,12 +137,16 @@ class WalletService:
         Raises:
             WalletNotFoundError: If wallet doesn't exist
         """
-        wallet = await self.get_wallet(wallet_id)
-        await wallet.delete()
-        logger.info(f"Deleted wallet {wallet_id}")
+        # Delete straight from Mongo; a cached copy may outlive the document
+        result = await WalletModel.find_one(WalletModel.id == wallet_id).delete()
+        if not result or not result.deleted_count:
+            raise WalletNotFoundError(str(wallet_id))
+        
+        await cache.delete(_wallet_cache_key(wallet_id), CACHE_KEY_WALLETS)
+        logger.info("Deleted wallet %s", wallet_id)
         return True
     
-    def to_response(self, wallet: WalletModel) -> WalletResponse:
+    def to_response(self, wallet: Union[WalletModel, WalletListProjection]) -> WalletResponse:
         """
         Convert wallet model to response DTO.
         
@@ -1,14 +1,148 @@
-"""Bitcoin wallet utilities using bitcoinlib."""
+"""Bitcoin wallet utilities using coincurve (libsecp256k1)."""
 
-from typing import Tuple
+import hashlib
+from typing import List, Optional, Tuple
 
-from bitcoinlib.keys import Key
-from bitcoinlib.wallets import Wallet
+import coincurve
 
 from app.exceptions import InvalidAddressError
 from app.utils.ethereum import encrypt_private_key as encrypt_key
 
 
+B58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+B58_INDEX = {char: index for index, char in enumerate(B58_ALPHABET)}
+
+BECH32_CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+BECH32_CONST = 1
+BECH32M_CONST = 0x2BC830A3
+
+P2PKH_VERSION = 0x00
+P2SH_VERSION = 0x05
+WIF_VERSION = 0x80
+SEGWIT_HRP = "bc"
+
+
+try:
+    hashlib.new("ripemd160")
+    
+    def _ripemd160(data: bytes) -> bytes:
+        return hashlib.new("ripemd160", data).digest()
+except ValueError:
+    # OpenSSL 3 builds may not expose RIPEMD-160 through hashlib
+    from Crypto.Hash import RIPEMD160
+    
+    def _ripemd160(data: bytes) -> bytes:
+        return RIPEMD160.new(data).digest()
+
+
+def _checksum(payload: bytes) -> bytes:
+    """First four bytes of the double SHA-256 of a payload."""
+    return hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4]
+
+
+def _b58check_encode(payload: bytes) -> str:
+    """Encode a payload as Base58Check."""
+    data = payload + _checksum(payload)
+    number = int.from_bytes(data, "big")
+    
+    chars = []
+    while number:
+        number, remainder = divmod(number, 58)
+        chars.append(B58_ALPHABET[remainder])
+    
+    padding = len(data) - len(data.lstrip(b"\x00"))
+    return "1" * padding + "".join(reversed(chars))
+
+
+def _b58check_decode(value: str) -> Optional[bytes]:
+    """Decode a Base58Check string, returning None if it is malformed."""
+    number = 0
+    for char in value:
+        index = B58_INDEX.get(char)
+        if index is None:
+            return None
+        number = number * 58 + index
+    
+    padding = len(value) - len(value.lstrip("1"))
+    body = number.to_bytes((number.bit_length() + 7) // 8, "big")
+    data = b"\x00" * padding + body
+    
+    if len(data) < 5 or _checksum(data[:-4]) != data[-4:]:
+        return None
+    return data[:-4]
+
+
+def _bech32_polymod(values: List[int]) -> int:
+    """Compute the BIP-173 checksum polynomial."""
+    generator = (0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)
+    checksum = 1
+    for value in values:
+        top = checksum >> 25
+        checksum = (checksum & 0x1FFFFFF) << 5 ^ value
+        for i in range(5):
+            if (top >> i) & 1:
+                checksum ^= generator[i]
+    return checksum
+
+
+def _convert_bits(data: List[int], from_bits: int, to_bits: int) -> Optional[List[int]]:
+    """Regroup bits without padding, returning None on invalid input."""
+    accumulator = 0
+    bits = 0
+    result = []
+    max_value = (1 << to_bits) - 1
+    
+    for value in data:
+        accumulator = (accumulator << from_bits) | value
+        bits += from_bits
+        while bits >= to_bits:
+            bits -= to_bits
+            result.append((accumulator >> bits) & max_value)
+    
+    if bits >= from_bits or (accumulator << (to_bits - bits)) & max_value:
+        return None
+    return result
+
+
+def _decode_segwit_address(hrp: str, address: str) -> Optional[Tuple[int, bytes]]:
+    """
+    Decode a bech32/bech32m segwit address.
+    
+    Returns:
+        Tuple of (witness version, witness program), or None if invalid
+    """
+    if address.lower() != address and address.upper() != address:
+        return None
+    
+    address = address.lower()
+    separator = address.rfind("1")
+    if separator < 1 or separator + 7 > len(address) or len(address) > 90:
+        return None
+    if address[:separator] != hrp:
+        return None
+    
+    data = []
+    for char in address[separator + 1:]:
+        index = BECH32_CHARSET.find(char)
+        if index < 0:
+            return None
+        data.append(index)
+    
+    hrp_expanded = [ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp]
+    version = data[0]
+    expected = BECH32_CONST if version == 0 else BECH32M_CONST
+    if _bech32_polymod(hrp_expanded + data) != expected:
+        return None
+    
+    program = _convert_bits(data[1:-6], 5, 8)
+    if program is None or version > 16 or not 2 <= len(program) <= 40:
+        return None
+    if version == 0 and len(program) not in (20, 32):
+        return None
+    
+    return version, bytes(program)
+
+
 def generate_bitcoin_wallet() -> Tuple[str, str, str]:
     """
     Generate a new Bitcoin wallet.
@@ -16,13 +150,16 @@ def generate_bitcoin_wallet() -> Tuple[str, str, str]:
     Returns:
         Tuple containing (address, public_key, private_key)
     """
-    key = Key()
+    key = coincurve.PrivateKey()
+    public_key = key.public_key.format(compressed=True)
     
-    address = key.address()
-    public_key = key.public_hex
-    private_key = key.wif()
+    # Legacy P2PKH address and compressed WIF
+    address = _b58check_encode(
+        bytes([P2PKH_VERSION]) + _ripemd160(hashlib.sha256(public_key).digest())
+    )
+    private_key = _b58check_encode(bytes([WIF_VERSION]) + key.secret + b"\x01")
     
-    return address, public_key, private_key
+    return address, public_key.hex(), private_key
 
 
 def validate_bitcoin_address(address: str) -> bool:
@@ -35,13 +172,14 @@ def validate_bitcoin_address(address: str) -> bool:
     Returns:
         True if valid, raises InvalidAddressError otherwise
     """
-    try:
-        key = Key(address)
-        if not key.address():
-            raise InvalidAddressError(address, "bitcoin")
+    payload = _b58check_decode(address)
+    if payload is not None and len(payload) == 21 and payload[0] in (P2PKH_VERSION, P2SH_VERSION):
+        return True
+    
+    if _decode_segwit_address(SEGWIT_HRP, address) is not None:
         return True
-    except Exception:
-        raise InvalidAddressError(address, "bitcoin")
+    
+    raise InvalidAddressError(address, "bitcoin")
 
 
 def encrypt_private_key(private_key: str) -> str:
@@ -3,6 +3,7 @@
 import base64
 import hashlib
 import os
+from functools import lru_cache
 from typing import Tuple
 
 from cryptography.fernet import Fernet
@@ -25,14 +26,8 @@ def generate_ethereum_wallet() -> Tuple[str, str, str]:
     
     address = account.address
     private_key = account.key.hex()
-    # Convert private key to public key using eth_keys (standardized via eth-account internals check)
-    # or simply return the address if public key isn't strictly needed, but requirements said "Store wallet data...".
-    # Let's use a safer way if available, or just the address if public key is strictly mapped.
-    # Actually, for standard EC usage:
-    from eth_keys import keys
-    private_key_bytes = account.key
-    private_key_obj = keys.PrivateKey(private_key_bytes)
-    public_key = private_key_obj.public_key.to_hex()
+    # LocalAccount already holds the eth_keys key pair it derived the address from
+    public_key = account._key_obj.public_key.to_hex()
     
     return address, public_key, private_key
 
@@ -53,6 +48,7 @@ def validate_ethereum_address(address: str) -> bool:
     return True
 
 
+@lru_cache(maxsize=1)
 def get_encryption_key() -> bytes:
     """
     Derive Fernet key from encryption key in settings.
@@ -67,6 +63,12 @@ def get_encryption_key() -> bytes:
     return base64.urlsafe_b64encode(derived_key)
 
 
+@lru_cache(maxsize=1)
+def _get_fernet() -> Fernet:
+    """Get the Fernet instance for the configured encryption key."""
+    return Fernet(get_encryption_key())
+
+
 def encrypt_private_key(private_key: str) -> str:
     """
     Encrypt a private key for secure storage.
@@ -78,7 +80,7 @@ def encrypt_private_key(private_key: str) -> str:
         Encrypted private key as base64 string
     """
     try:
-        fernet = Fernet(get_encryption_key())
+        fernet = _get_fernet()
         encrypted = fernet.encrypt(private_key.encode())
         return encrypted.decode()
     except Exception as e:
@@ -96,7 +98,7 @@ def decrypt_private_key(encrypted_key: str) -> str:
         Decrypted private key
     """
     try:
-        fernet = Fernet(get_encryption_key())
+        fernet = _get_fernet()
         decrypted = fernet.decrypt(encrypted_key.encode())
         return decrypted.decode()
     except Exception as e: